@@ -0,0 +1,193 @@
+"""Shared helpers for the raxtax benchmark scripts."""
+
+import mmap
+import os
+import random
+import select
+import subprocess
+import time
+
+import psutil
+
+DEFAULT_SAMPLE_INTERVAL = 0.25
+DEFAULT_OUTPUT_BUFFER_SIZE = 8 << 20
+
+
+def _read_peak_rss(process, status):
+    """Return the child's peak RSS in bytes so far, or None once it is gone.
+
+    /proc/<pid>/status is read in one gulp and VmHWM extracted: the kernel
+    maintains that high-water mark itself, so an RSS spike between two
+    samples cannot slip past the sampler. Reading the file directly is a
+    single syscall plus a trivial parse, so the sampler perturbs the timed
+    child as little as possible.
+    """
+    if status is not None:
+        try:
+            status.seek(0)
+            for line in status.read().splitlines():
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+            return None
+        except (OSError, ValueError, IndexError):
+            return None
+    try:
+        return process.memory_info().rss
+    except psutil.NoSuchProcess:
+        return None
+
+
+def run_program(cmd, sample_interval=DEFAULT_SAMPLE_INTERVAL, cpus=None, log_path=None):
+    """Run cmd to completion and return (runtime in seconds, peak RSS in bytes).
+
+    On Linux (Python >= 3.9) the child is awaited through a pidfd, so the
+    driver sleeps in poll() between memory samples instead of spinning on
+    process.poll() and stealing scheduler time from the timed child.
+    Memory is sampled every sample_interval seconds. If cpus is given, the
+    child is pinned to that CPU set before exec. stdout/stderr go to
+    log_path (or are discarded if None); a non-zero exit raises RuntimeError
+    so a crashed run can never masquerade as a measurement.
+    """
+    preexec_fn = None
+    if cpus and hasattr(os, "sched_setaffinity"):
+        preexec_fn = lambda: os.sched_setaffinity(0, cpus)  # noqa: E731
+    # A log file (or DEVNULL), not PIPE: nobody drains pipes here, so a
+    # chatty child would block on a full pipe buffer and the stall would be
+    # billed as runtime.
+    if log_path is not None:
+        output = open(log_path, "wb")
+    else:
+        output = subprocess.DEVNULL
+    start = time.monotonic()
+    try:
+        process = psutil.Popen(
+            cmd, stdout=output, stderr=subprocess.STDOUT, preexec_fn=preexec_fn
+        )
+    finally:
+        if log_path is not None:
+            output.close()
+    try:
+        status = open(f"/proc/{process.pid}/status")
+    except OSError:
+        status = None
+    max_rss = 0
+    try:
+        if hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(process.pid)
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                while True:
+                    events = poller.poll(int(sample_interval * 1000))
+                    # VmHWM is monotonic, so sampling it on exit notification
+                    # as well leaves at most the final partial interval of
+                    # growth unobserved (zombies drop their Vm* fields, in
+                    # which case the previous sample stands).
+                    rss = _read_peak_rss(process, status)
+                    if rss is not None and rss > max_rss:
+                        max_rss = rss
+                    if events or rss is None:
+                        break
+            finally:
+                os.close(pidfd)
+            process.wait()
+        else:
+            while process.poll() is None:
+                rss = _read_peak_rss(process, status)
+                if rss is None:
+                    break
+                if rss > max_rss:
+                    max_rss = rss
+                time.sleep(sample_interval)
+            # The loop may break on a failed sample while the child is still
+            # a zombie; reap it here like the pidfd path does.
+            process.wait()
+    finally:
+        if status is not None:
+            status.close()
+    end = time.monotonic()
+    if process.returncode != 0:
+        where = f", see {log_path}" if log_path is not None else ""
+        raise RuntimeError(f"{cmd[0]} exited with code {process.returncode}{where}")
+    return end - start, max_rss
+
+
+def prefault(path, chunk_size=16 << 20):
+    """Read path once in large chunks to pull it into the page cache.
+
+    Run on the database and query files right before timing, so the first
+    repetition does not pay cold-cache disk latency the later ones skip.
+    """
+    buf = bytearray(chunk_size)
+    with open(path, "rb", buffering=0) as f:
+        while f.readinto(buf):
+            pass
+
+
+def _parse_fasta(handle):
+    """Yield (title, sequence) bytes pairs from a fasta handle or mmap."""
+    title = None
+    seq = []
+    for line in iter(handle.readline, b""):
+        line = line.rstrip()
+        if line.startswith(b">"):
+            if title is not None:
+                yield title, b"".join(seq)
+            title = line[1:]
+            seq = []
+        elif line:
+            seq.append(line)
+    if title is not None:
+        yield title, b"".join(seq)
+
+
+def _write_fasta(path, records, buffer_size=DEFAULT_OUTPUT_BUFFER_SIZE):
+    """Write (title, sequence) bytes pairs to path in fasta format."""
+    # One pre-joined buffer and one write() instead of four small writes per
+    # record bouncing through the buffered-IO layer. The large buffer covers
+    # anything smaller that still goes through buffered IO.
+    buffer = b"".join(b">%b\n%b\n" % record for record in records)
+    with open(path, "wb", buffering=buffer_size) as f:
+        f.write(buffer)
+
+
+def sample_fasta(
+    input_file,
+    output_90,
+    output_10,
+    num_samples,
+    seed=42,
+    buffer_size=DEFAULT_OUTPUT_BUFFER_SIZE,
+):
+    """Sample num_samples records from input_file and split them 90/10.
+
+    The 90% split serves as the database and the 10% split as the queries,
+    mirroring how the raxtax paper benchmarks are set up.
+    """
+    rng = random.Random(seed)
+    # Reservoir sampling (Algorithm R): a uniform sample in one streaming
+    # pass, holding num_samples records instead of the whole file.
+    sampled = []
+    # Map the file instead of read()ing it: repeated sweeps over the same
+    # input then come straight out of the page cache without copies into
+    # userspace buffers.
+    with open(input_file, "rb") as handle, mmap.mmap(
+        handle.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        for n, record in enumerate(_parse_fasta(mm)):
+            if n < num_samples:
+                sampled.append(record)
+            else:
+                j = rng.randrange(n + 1)
+                if j < num_samples:
+                    sampled[j] = record
+    if len(sampled) < num_samples:
+        raise ValueError(
+            f"{input_file} holds only {len(sampled)} records, cannot sample {num_samples}"
+        )
+    # The reservoir is a uniform subset, but its order is not; shuffle so the
+    # 90/10 split is unbiased.
+    rng.shuffle(sampled)
+    split = int(num_samples * 0.9)
+    _write_fasta(output_90, sampled[:split], buffer_size)
+    _write_fasta(output_10, sampled[split:], buffer_size)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark runtime and peak memory of raxtax vs. sintax across database sizes."""
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import common
+
+
+def _one_rep(args, num_samples, i):
+    """Run one repetition for one sample size and return its measurement rows."""
+    stem = f"{num_samples}_rep{i + 1}"
+    rep_dir = args.output_dir / stem
+    rep_dir.mkdir(parents=True, exist_ok=True)
+    output_90 = rep_dir / f"{stem}_90pct.fasta"
+    output_10 = rep_dir / f"{stem}_10pct.fasta"
+    # Sampling is deterministic in (input, num_samples, seed), so files left
+    # over from an earlier run can be reused unless --redo asks otherwise.
+    if args.redo or not (output_90.exists() and output_10.exists()):
+        common.sample_fasta(
+            args.input,
+            output_90,
+            output_10,
+            num_samples,
+            seed=i,
+            buffer_size=args.output_buffer_size,
+        )
+    raxtax_cmd = [
+        args.raxtax,
+        "-d",
+        output_90,
+        "-i",
+        output_10,
+        "-t",
+        str(args.threads),
+        "-o",
+        rep_dir / "raxtax",
+        "--redo",
+    ]
+    sintax_cmd = [
+        args.sintax,
+        "--sintax",
+        output_10,
+        "--db",
+        output_90,
+        "--tabbedout",
+        rep_dir / "sintax.out",
+        "--threads",
+        str(args.threads),
+    ]
+    common.prefault(output_90)
+    common.prefault(output_10)
+    rows = []
+    for tool, cmd in (("raxtax", raxtax_cmd), ("sintax", sintax_cmd)):
+        runtime, memory = common.run_program(
+            cmd, args.sample_interval, log_path=rep_dir / f"{tool}.log"
+        )
+        rows.append([tool, num_samples, i + 1, runtime, memory])
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-i", "--input", type=Path, required=True, help="Full fasta file to sample databases from"
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=Path("bench"),
+        help="Directory for sampled files and results",
+    )
+    parser.add_argument("--raxtax", default="raxtax", help="raxtax binary")
+    parser.add_argument("--sintax", default="vsearch", help="vsearch binary (for sintax)")
+    parser.add_argument(
+        "-n",
+        "--sample-sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 10000, 100000],
+        help="Number of sequences to sample per run",
+    )
+    parser.add_argument("-r", "--repetitions", type=int, default=3)
+    parser.add_argument(
+        "-t", "--threads", type=int, default=0, help="Threads for raxtax and sintax (0 = all)"
+    )
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=common.DEFAULT_SAMPLE_INTERVAL,
+        help="Seconds between memory samples",
+    )
+    parser.add_argument(
+        "--output-buffer-size",
+        type=int,
+        default=common.DEFAULT_OUTPUT_BUFFER_SIZE,
+        help="Write buffer size in bytes for sampled fasta files",
+    )
+    parser.add_argument(
+        "--redo", action="store_true", help="Re-sample even if sampled files already exist"
+    )
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    csv_file = args.output_dir / "runtime_memory.csv"
+
+    jobs = [
+        (num_samples, i)
+        for num_samples in args.sample_sizes
+        for i in range(args.repetitions)
+    ]
+    # Repetitions are independent (separate rep directories), so overlap them
+    # unless the tools themselves would already saturate the machine.
+    threads = args.threads or os.cpu_count()
+    if threads * args.repetitions <= os.cpu_count():
+        with ProcessPoolExecutor(
+            max_workers=max(1, os.cpu_count() // threads)
+        ) as executor:
+            futures = [
+                executor.submit(_one_rep, args, num_samples, i) for num_samples, i in jobs
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [_one_rep(args, num_samples, i) for num_samples, i in jobs]
+
+    with open(csv_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["tool", "num_samples", "rep", "runtime", "memory"])
+        for rows in results:
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
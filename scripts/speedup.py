@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""Benchmark parallel speedup of raxtax vs. sintax across thread counts."""
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import common
+
+# Affinity decisions are always made against this snapshot, never the current
+# mask: _one_rep shrinks the process mask while a child runs, and deriving the
+# next rep's sets from an already-shrunk mask would silently hand later sweeps
+# only part of the machine.
+_ORIGINAL_CPUS = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else []
+
+
+def _one_rep(args, num_threads, i, output_90, output_10, cpu_offset=0):
+    """Run one repetition for one thread count and return its measurement rows."""
+    rep_dir = args.output_dir / f"{num_threads}threads_rep{i + 1}"
+    rep_dir.mkdir(parents=True, exist_ok=True)
+    # Pin the timed child and this sampler process to disjoint CPU sets, so
+    # the scaling numbers are not polluted by the sampler (or a concurrent
+    # repetition, hence cpu_offset) competing for the child's cores. Strict
+    # less-than keeps at least one CPU for the sampler.
+    child_cpus = None
+    if hasattr(os, "sched_setaffinity"):
+        if cpu_offset + num_threads < len(_ORIGINAL_CPUS):
+            child_cpus = set(_ORIGINAL_CPUS[cpu_offset : cpu_offset + num_threads])
+            os.sched_setaffinity(0, set(_ORIGINAL_CPUS) - child_cpus)
+    try:
+        raxtax_cmd = [
+            args.raxtax,
+            "-d",
+            output_90,
+            "-i",
+            output_10,
+            "-t",
+            str(num_threads),
+            "-o",
+            rep_dir / "raxtax",
+            "--redo",
+        ]
+        sintax_cmd = [
+            args.sintax,
+            "--sintax",
+            output_10,
+            "--db",
+            output_90,
+            "--tabbedout",
+            rep_dir / "sintax.out",
+            "--threads",
+            str(num_threads),
+        ]
+        common.prefault(output_90)
+        common.prefault(output_10)
+        rows = []
+        for tool, cmd in (("raxtax", raxtax_cmd), ("sintax", sintax_cmd)):
+            runtime, memory = common.run_program(
+                cmd, args.sample_interval, cpus=child_cpus, log_path=rep_dir / f"{tool}.log"
+            )
+            rows.append([tool, num_threads, i + 1, runtime, memory])
+        return rows
+    finally:
+        # Restore the full mask so later reps (and anything else this
+        # process runs) are not stuck on the shrunk set.
+        if child_cpus is not None:
+            os.sched_setaffinity(0, set(_ORIGINAL_CPUS))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "-i", "--input", type=Path, required=True, help="Full fasta file to sample databases from"
+    )
+    parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        default=Path("bench"),
+        help="Directory for sampled files and results",
+    )
+    parser.add_argument("--raxtax", default="raxtax", help="raxtax binary")
+    parser.add_argument("--sintax", default="vsearch", help="vsearch binary (for sintax)")
+    parser.add_argument(
+        "-n", "--num-samples", type=int, default=100000, help="Number of sequences to sample"
+    )
+    parser.add_argument(
+        "-t",
+        "--thread-counts",
+        type=int,
+        nargs="+",
+        default=[1, 2, 4, 8, 16],
+        help="Thread counts to sweep",
+    )
+    parser.add_argument("-r", "--repetitions", type=int, default=3)
+    parser.add_argument(
+        "--sample-interval",
+        type=float,
+        default=common.DEFAULT_SAMPLE_INTERVAL,
+        help="Seconds between memory samples",
+    )
+    parser.add_argument(
+        "--output-buffer-size",
+        type=int,
+        default=common.DEFAULT_OUTPUT_BUFFER_SIZE,
+        help="Write buffer size in bytes for sampled fasta files",
+    )
+    parser.add_argument(
+        "--redo", action="store_true", help="Re-sample even if sampled files already exist"
+    )
+    args = parser.parse_args()
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    csv_file = args.output_dir / "speedup.csv"
+
+    # The sampled sequences are independent of the thread count (and we want
+    # them held constant across the sweep anyway), so sample once per
+    # repetition instead of once per (thread count, repetition) pair.
+    num_samples = args.num_samples
+    sampled = []
+    for i in range(args.repetitions):
+        stem = f"{num_samples}_rep{i + 1}"
+        output_90 = args.output_dir / f"{stem}_90pct.fasta"
+        output_10 = args.output_dir / f"{stem}_10pct.fasta"
+        # Sampling is deterministic in (input, num_samples, seed), so files
+        # left over from an earlier run can be reused unless --redo asks
+        # otherwise.
+        if args.redo or not (output_90.exists() and output_10.exists()):
+            common.sample_fasta(
+                args.input,
+                output_90,
+                output_10,
+                num_samples,
+                seed=i,
+                buffer_size=args.output_buffer_size,
+            )
+        sampled.append((output_90, output_10))
+
+    results = []
+    for num_threads in args.thread_counts:
+        # Repetitions are independent (separate rep directories), so overlap
+        # them unless that would oversubscribe the machine and skew the very
+        # scaling numbers this script measures. The gate mirrors the pinning
+        # guard in _one_rep: it is based on the affinity snapshot (cgroups or
+        # taskset can allow fewer CPUs than os.cpu_count() reports) and strict,
+        # so every concurrent rep gets its own pinnable slice plus a sampler
+        # CPU; otherwise all reps run sequentially and are treated uniformly.
+        if _ORIGINAL_CPUS and num_threads * args.repetitions < len(_ORIGINAL_CPUS):
+            with ProcessPoolExecutor(
+                max_workers=max(1, len(_ORIGINAL_CPUS) // num_threads)
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _one_rep, args, num_threads, i, *sampled[i], cpu_offset=i * num_threads
+                    )
+                    for i in range(args.repetitions)
+                ]
+                results.extend(future.result() for future in futures)
+        else:
+            results.extend(
+                _one_rep(args, num_threads, i, *sampled[i]) for i in range(args.repetitions)
+            )
+
+    with open(csv_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["tool", "num_threads", "rep", "runtime", "memory"])
+        for rows in results:
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()